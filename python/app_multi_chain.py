@@ -10,14 +10,24 @@ import os
 import sys
 import json
 import logging
+import array
 import asyncio
+import concurrent.futures
+import threading
 import time
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from pathlib import Path
+import orjson
 from flask import Flask, jsonify, request, Response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from gunicorn.app.base import BaseApplication
+from prometheus_client import CONTENT_TYPE_LATEST
 from configuration_multi_chain import MultiChainConfiguration
+from metrics_registry import MetricsRegistry
 from multi_chain_core import MultiChainCore
+from slack_notifier import ALERT_COLORS, SlackNotifier
+import transaction_simulator
 
 # Set up logging
 logging.basicConfig(
@@ -30,15 +40,173 @@ logging.basicConfig(
 )
 logger = logging.getLogger("App")
 
+# API server settings
+API_PORT = int(os.getenv("API_PORT", "5001"))
+API_THREADS = int(os.getenv("API_THREADS", "8"))
+# Seconds allowed for initialization (Vault, RPC connects, Slack warm-up)
+API_STARTUP_TIMEOUT = int(os.getenv("API_STARTUP_TIMEOUT", "120"))
+# Seconds allowed for stopping the bot when the worker exits
+API_SHUTDOWN_TIMEOUT = int(os.getenv("API_SHUTDOWN_TIMEOUT", "20"))
+# Slack rate-limit bucket for /api/test-alert, separate from real alerts
+TEST_ALERT_BUCKET = "TEST"
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes responses with orjson."""
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.option)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def get_json_fast(req: Any) -> Dict[str, Any]:
+    """Parse a JSON request body once with orjson.
+    
+    Args:
+        req: The Flask request
+        
+    Returns:
+        The decoded JSON object, or an empty dict if the body is empty
+        
+    Raises:
+        ValueError: If the body is not a JSON object
+    """
+    body = req.get_data(cache=False)
+    if not body:
+        return {}
+    data = orjson.loads(body)
+    if not isinstance(data, dict):
+        raise ValueError("Request body must be a JSON object")
+    return data
+
+
+class _ResponseCache:
+    """Keeps a serialized JSON response for a short TTL.
+
+    Probes arriving within the TTL get the stored bytes back; concurrent
+    probes on expiry wait on the lock and share a single computation.
+    """
+
+    def __init__(self, ttl_ns: int) -> None:
+        self._ttl_ns = ttl_ns
+        self._lock = threading.Lock()
+        self._ts_ns: Optional[int] = None
+        self._body = b""
+        self._status_code = 200
+
+    def get(self, compute: Callable[[], Tuple[Dict[str, Any], int]]) -> Response:
+        with self._lock:
+            now = time.monotonic_ns()
+            if self._ts_ns is None or now - self._ts_ns >= self._ttl_ns:
+                body, self._status_code = compute()
+                self._body = orjson.dumps(body, option=OrjsonProvider.option)
+                self._ts_ns = now
+            return Response(self._body, status=self._status_code, mimetype="application/json")
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._ts_ns = None
+
+
 # Create Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
 # Global variables
 config = None
 core = None
-bot_status = "stopped"
-bot_task = None
+notifier = None
+metrics_registry = MetricsRegistry()
+_run_task: Optional[asyncio.Task] = None  # run_core's task on the background loop
+
+class _BotStatus:
+    """Bot states stored in ``_status``."""
+    STOPPED = 0
+    STARTING = 1
+    RUNNING = 2
+    STOPPING = 3
+    ERROR = 4
+
+_STATUS_NAME = ("stopped", "starting", "running", "stopping", "error")
+
+# Current _BotStatus value: a single int slot read without locking;
+# check-and-set transitions take _status_lock
+_status = array.array("i", [_BotStatus.STOPPED])
+_status_lock = threading.Lock()
+
+# Load balancers and Prometheus poll these every few seconds
+HEALTH_CACHE_TTL_NS = 500_000_000
+_health_cache = _ResponseCache(HEALTH_CACHE_TTL_NS)
+_status_cache = _ResponseCache(HEALTH_CACHE_TTL_NS)
+
+# Persistent event loop that runs the core; Flask handlers submit to it
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_loop_lock = threading.Lock()
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its thread on first use.
+    
+    The loop is created lazily rather than at import so that it is started
+    in the gunicorn worker, not in the master process that forks it.
+    
+    Returns:
+        The running background event loop
+    """
+    global _bg_loop
+    with _bg_loop_lock:
+        if _bg_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=_run_loop, args=(loop,), name="AsyncioLoop", daemon=True).start()
+            _bg_loop = loop
+        return _bg_loop
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Run ``loop`` until it is stopped, then close it.
+    
+    Args:
+        loop: The background event loop
+    """
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+def _set_bot_status(new_status: int) -> None:
+    """Update the bot status and drop cached responses that report it.
+    
+    Args:
+        new_status: The new _BotStatus value
+    """
+    _status[0] = new_status
+    metrics_registry.set_bot_status(_STATUS_NAME[new_status])
+    _health_cache.invalidate()
+    _status_cache.invalidate()
+
+def _transition_bot_status(allowed: Tuple[int, ...], new_status: int) -> Tuple[bool, int]:
+    """Atomically move to ``new_status`` if the current status is in ``allowed``.
+    
+    Args:
+        allowed: The _BotStatus values the transition may start from
+        new_status: The _BotStatus value to move to
+        
+    Returns:
+        A tuple of (transitioned, previous status)
+    """
+    with _status_lock:
+        current = _status[0]
+        if current not in allowed:
+            return False, current
+        _set_bot_status(new_status)
+        return True, current
 
 # Initialize configuration and core
 async def initialize() -> bool:
@@ -47,16 +215,19 @@ async def initialize() -> bool:
     Returns:
         True if initialization was successful, False otherwise
     """
-    global config, core
+    global config, core, notifier
     
     try:
         # Load configuration
         logger.info("Loading configuration...")
         config = MultiChainConfiguration()
         
+        # Create the process-wide Slack notifier
+        notifier = SlackNotifier(config.SLACK_WEBHOOK_URL)
+        
         # Create core
         logger.info("Creating MultiChainCore...")
-        core = MultiChainCore(config)
+        core = MultiChainCore(config, metrics_registry)
         
         # Initialize core
         logger.info("Initializing MultiChainCore...")
@@ -65,81 +236,113 @@ async def initialize() -> bool:
             logger.error("Failed to initialize MultiChainCore")
             return False
         
+        # Connect to Slack last, so the pooled connection is still within its
+        # keep-alive window when the server starts taking requests
+        notifier.warm_up()
+        
         logger.info("Initialization complete")
         return True
     except Exception as e:
-        logger.error(f"Error during initialization: {e}")
+        logger.error("Error during initialization: %s", e)
         return False
 
 # Health check
-@app.route("/healthz", methods=["GET"])
-def healthz() -> Tuple[Dict[str, Any], int]:
-    """Health check endpoint.
+def _compute_health() -> Tuple[Dict[str, Any], int]:
+    """Build the health check response.
     
     Returns:
-        A tuple of (response, status_code)
+        A tuple of (response body, status_code)
     """
     try:
         # Check if configuration is loaded
         if config is None:
-            return jsonify({
+            return {
                 "status": "error",
                 "message": "Configuration not loaded",
                 "go_live": False,
-            }), 500
+            }, 500
         
         # Check if core is initialized
         if core is None:
-            return jsonify({
+            return {
                 "status": "error",
                 "message": "Core not initialized",
                 "go_live": config.GO_LIVE,
-            }), 500
+            }, 500
         
         # Check if any chains are active
         if not core.workers:
-            return jsonify({
+            return {
                 "status": "error",
                 "message": "No active chains",
                 "go_live": config.GO_LIVE,
-            }), 500
+            }, 500
         
         # Check Vault connectivity if GO_LIVE is true
         if config.GO_LIVE:
-            if not hasattr(config, "VAULT_ADDR") or not config.VAULT_ADDR:
-                return jsonify({
+            if not config.VAULT_ADDR:
+                return {
                     "status": "error",
                     "message": "VAULT_ADDR not set",
                     "go_live": config.GO_LIVE,
-                }), 500
+                }, 500
             
-            if not hasattr(config, "VAULT_TOKEN") or not config.VAULT_TOKEN:
-                return jsonify({
+            if not config.VAULT_TOKEN:
+                return {
                     "status": "error",
                     "message": "VAULT_TOKEN not set",
                     "go_live": config.GO_LIVE,
-                }), 500
+                }, 500
         
         # All checks passed
-        return jsonify({
+        return {
             "status": "ok",
             "message": "Service is healthy",
             "go_live": config.GO_LIVE,
             "active_chains": len(core.workers),
-            "bot_status": bot_status,
-        }), 200
+            "bot_status": _STATUS_NAME[_status[0]],
+        }, 200
     except Exception as e:
-        logger.error(f"Error in health check: {e}")
-        return jsonify({
+        logger.error("Error in health check: %s", e)
+        return {
             "status": "error",
             "message": f"Error in health check: {str(e)}",
-            "go_live": getattr(config, "GO_LIVE", False) if config else False,
-        }), 500
+            "go_live": config.GO_LIVE if config else False,
+        }, 500
+
+@app.route("/healthz", methods=["GET"])
+def healthz() -> Response:
+    """Health check endpoint.
+    
+    Returns:
+        The health check response, reused for HEALTH_CACHE_TTL_NS
+    """
+    return _health_cache.get(_compute_health)
 
-# Metrics endpoint
+# Metrics endpoints
 @app.route("/metrics", methods=["GET"])
+def prometheus_metrics() -> Response:
+    """Prometheus metrics endpoint.
+    
+    Returns:
+        The metrics in the Prometheus text exposition format
+    """
+    try:
+        # Zeroed gauges would hide an uninitialized core from health checks
+        if core is None:
+            return Response("Core not initialized\n", status=503, mimetype="text/plain")
+        
+        # Refresh the gauges from the core
+        core.get_metrics()
+        
+        return Response(metrics_registry.latest(), content_type=CONTENT_TYPE_LATEST)
+    except Exception as e:
+        logger.error("Error getting metrics: %s", e)
+        return Response(f"Error getting metrics: {e}\n", status=500, mimetype="text/plain")
+
+@app.route("/api/metrics", methods=["GET"])
 def metrics() -> Dict[str, Any]:
-    """Metrics endpoint.
+    """JSON metrics endpoint.
     
     Returns:
         A dictionary of metrics
@@ -156,38 +359,46 @@ def metrics() -> Dict[str, Any]:
         metrics = core.get_metrics()
         
         # Add bot status
-        metrics["bot_status"] = bot_status
+        metrics["bot_status"] = _STATUS_NAME[_status[0]]
         
         return jsonify(metrics)
     except Exception as e:
-        logger.error(f"Error getting metrics: {e}")
+        logger.error("Error getting metrics: %s", e)
         return jsonify({
             "status": "error",
             "message": f"Error getting metrics: {str(e)}",
         }), 500
 
 # Status endpoint
-@app.route("/status", methods=["GET"])
-def status() -> Dict[str, Any]:
-    """Status endpoint.
+def _compute_status() -> Tuple[Dict[str, Any], int]:
+    """Build the status response.
     
     Returns:
-        A dictionary with the current status
+        A tuple of (response body, status_code)
     """
     try:
-        return jsonify({
-            "status": bot_status,
-            "go_live": getattr(config, "GO_LIVE", False) if config else False,
-            "dry_run": getattr(config, "DRY_RUN", True) if config else True,
+        return {
+            "status": _STATUS_NAME[_status[0]],
+            "go_live": config.GO_LIVE if config else False,
+            "dry_run": config.DRY_RUN if config else True,
             "active_chains": len(core.workers) if core else 0,
             "uptime": core.metrics["uptime_seconds"] if core else 0,
-        })
+        }, 200
     except Exception as e:
-        logger.error(f"Error getting status: {e}")
-        return jsonify({
+        logger.error("Error getting status: %s", e)
+        return {
             "status": "error",
             "message": f"Error getting status: {str(e)}",
-        }), 500
+        }, 500
+
+@app.route("/status", methods=["GET"])
+def status() -> Response:
+    """Status endpoint.
+    
+    Returns:
+        The current status, reused for HEALTH_CACHE_TTL_NS
+    """
+    return _status_cache.get(_compute_status)
 
 # Start bot endpoint
 @app.route("/start", methods=["POST"])
@@ -197,16 +408,7 @@ def start_bot() -> Dict[str, Any]:
     Returns:
         A dictionary with the result
     """
-    global bot_status, bot_task
-    
     try:
-        # Check if bot is already running
-        if bot_status == "running":
-            return jsonify({
-                "status": "error",
-                "message": "Bot is already running",
-            }), 400
-        
         # Check if core is initialized
         if core is None:
             return jsonify({
@@ -214,32 +416,43 @@ def start_bot() -> Dict[str, Any]:
                 "message": "Core not initialized",
             }), 500
         
+        # Claim the start unless the bot is already starting, running or stopping
+        started, current = _transition_bot_status(
+            (_BotStatus.STOPPED, _BotStatus.ERROR), _BotStatus.STARTING
+        )
+        if not started:
+            return jsonify({
+                "status": "error",
+                "message": f"Bot is already {_STATUS_NAME[current]}",
+            }), 400
+        
         # Start the bot
         logger.info("Starting bot...")
-        bot_status = "starting"
         
         # Create task to run the core
         async def run_core():
-            global bot_status
+            global _run_task
+            _run_task = asyncio.current_task()
+            if not _transition_bot_status((_BotStatus.STARTING,), _BotStatus.RUNNING)[0]:
+                return
             try:
-                bot_status = "running"
                 await core.run()
             except Exception as e:
-                logger.error(f"Error running core: {e}")
+                logger.error("Error running core: %s", e)
             finally:
-                bot_status = "stopped"
+                # Only once the run has fully unwound may a new /start claim the bot
+                _transition_bot_status((_BotStatus.RUNNING, _BotStatus.STOPPING), _BotStatus.STOPPED)
         
-        # Start the task
-        loop = asyncio.get_event_loop()
-        bot_task = loop.create_task(run_core())
+        # Start the task on the background loop
+        asyncio.run_coroutine_threadsafe(run_core(), _background_loop())
         
         return jsonify({
             "status": "success",
             "message": "Bot started",
         })
     except Exception as e:
-        logger.error(f"Error starting bot: {e}")
-        bot_status = "error"
+        logger.error("Error starting bot: %s", e)
+        _transition_bot_status((_BotStatus.STARTING,), _BotStatus.ERROR)
         return jsonify({
             "status": "error",
             "message": f"Error starting bot: {str(e)}",
@@ -253,16 +466,7 @@ def stop_bot() -> Dict[str, Any]:
     Returns:
         A dictionary with the result
     """
-    global bot_status, bot_task
-    
     try:
-        # Check if bot is running
-        if bot_status != "running":
-            return jsonify({
-                "status": "error",
-                "message": f"Bot is not running (status: {bot_status})",
-            }), 400
-        
         # Check if core is initialized
         if core is None:
             return jsonify({
@@ -270,37 +474,50 @@ def stop_bot() -> Dict[str, Any]:
                 "message": "Core not initialized",
             }), 500
         
+        # Claim the stop only if the bot is running
+        stopping, current = _transition_bot_status((_BotStatus.RUNNING,), _BotStatus.STOPPING)
+        if not stopping:
+            return jsonify({
+                "status": "error",
+                "message": f"Bot is not running (status: {_STATUS_NAME[current]})",
+            }), 400
+        
         # Stop the bot
         logger.info("Stopping bot...")
-        bot_status = "stopping"
-        
-        # Create task to stop the core
-        async def stop_core():
-            global bot_status
-            try:
-                await core.stop()
-                if bot_task:
-                    bot_task.cancel()
-            except Exception as e:
-                logger.error(f"Error stopping core: {e}")
-            finally:
-                bot_status = "stopped"
         
-        # Start the task
-        loop = asyncio.get_event_loop()
-        loop.create_task(stop_core())
+        # Stop the core on the background loop
+        asyncio.run_coroutine_threadsafe(stop_core(), _background_loop())
         
         return jsonify({
             "status": "success",
             "message": "Bot stopping",
         })
     except Exception as e:
-        logger.error(f"Error stopping bot: {e}")
+        logger.error("Error stopping bot: %s", e)
         return jsonify({
             "status": "error",
             "message": f"Error stopping bot: {str(e)}",
         }), 500
 
+async def stop_core() -> None:
+    """Stop the core, then wait for a running bot to unwind.
+    
+    The caller must have moved the bot status to STOPPING (or it must be
+    STOPPED already); run_core sets STOPPED once the run has finished.
+    """
+    try:
+        if core is not None:
+            await core.stop()
+    except Exception as e:
+        logger.error("Error stopping core: %s", e)
+    finally:
+        # Cancel the run and wait for it to unwind
+        task = _run_task
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        _transition_bot_status((_BotStatus.STOPPING,), _BotStatus.STOPPED)
+
 # Test alert endpoint
 @app.route("/api/test-alert", methods=["POST"])
 def test_alert() -> Dict[str, Any]:
@@ -317,17 +534,55 @@ def test_alert() -> Dict[str, Any]:
                 "message": "Core not initialized",
             }), 500
         
+        # Check if notifier is initialized
+        if notifier is None:
+            return jsonify({
+                "status": "error",
+                "message": "Notifier not initialized",
+            }), 500
+        
+        # Get request data
+        data = get_json_fast(request)
+        message = data.get("message", "Test alert from ON1Builder")
+        level = data.get("level", "INFO")
+        if not isinstance(level, str):
+            return jsonify({
+                "status": "error",
+                "message": "level must be a string",
+            }), 400
+        level = level.upper()
+        if level not in ALERT_COLORS:
+            return jsonify({
+                "status": "error",
+                "message": f"level must be one of {', '.join(ALERT_COLORS)}",
+            }), 400
+        
         # Log test alert
         logger.info("Sending test alert")
         
-        # TODO: Implement alert sending
+        if not notifier.enabled:
+            return jsonify({
+                "status": "error",
+                "message": "SLACK_WEBHOOK_URL not set",
+            }), 500
+        
+        # Test alerts are never deduplicated and have their own rate-limit
+        # budget, so they cannot crowd out real alerts of the same level
+        if not notifier.send(
+            message, level, {"active_chains": len(core.workers)},
+            dedup=False, rate_bucket=TEST_ALERT_BUCKET,
+        ):
+            return jsonify({
+                "status": "error",
+                "message": "Test alert suppressed (rate limited or queue full)",
+            }), 429
         
         return jsonify({
             "status": "success",
-            "message": "Test alert sent",
+            "message": "Test alert queued",
         })
     except Exception as e:
-        logger.error(f"Error sending test alert: {e}")
+        logger.error("Error sending test alert: %s", e)
         return jsonify({
             "status": "error",
             "message": f"Error sending test alert: {str(e)}",
@@ -336,7 +591,7 @@ def test_alert() -> Dict[str, Any]:
 # Simulate transaction endpoint
 @app.route("/api/simulate-transaction", methods=["POST"])
 def simulate_transaction() -> Dict[str, Any]:
-    """Simulate a transaction.
+    """Simulate one transaction, or a batch given as an ``opportunities`` list.
     
     Returns:
         A dictionary with the result
@@ -350,8 +605,19 @@ def simulate_transaction() -> Dict[str, Any]:
             }), 500
         
         # Get request data
-        data = request.json or {}
-        chain_id = data.get("chain_id", "1")
+        data = get_json_fast(request)
+        if "opportunities" in data:
+            opportunities = data["opportunities"]
+            if not isinstance(opportunities, list) or not all(
+                isinstance(o, dict) for o in opportunities
+            ):
+                return jsonify({
+                    "status": "error",
+                    "message": "opportunities must be a list of objects",
+                }), 400
+            return _simulate_batch(opportunities)
+        
+        chain_id = str(data.get("chain_id", "1"))
         
         # Check if chain is active
         if chain_id not in core.workers:
@@ -361,29 +627,77 @@ def simulate_transaction() -> Dict[str, Any]:
             }), 400
         
         # Log simulation
-        logger.info(f"Simulating transaction on chain {chain_id}")
+        logger.info("Simulating transaction on chain %s", chain_id)
         
-        # TODO: Implement transaction simulation
+        try:
+            result = transaction_simulator.simulate_transaction(chain_id, data)
+        except ValueError as e:
+            return jsonify({
+                "status": "error",
+                "message": str(e),
+            }), 400
         
         return jsonify({
             "status": "success",
             "message": "Transaction simulated",
             "chain_id": chain_id,
-            "result": {
-                "success": True,
-                "gas_used": 100000,
-                "gas_price_gwei": 20,
-                "estimated_cost_eth": 0.002,
-                "estimated_profit_eth": 0.005,
-            },
+            "result": result,
         })
     except Exception as e:
-        logger.error(f"Error simulating transaction: {e}")
+        logger.error("Error simulating transaction: %s", e)
         return jsonify({
             "status": "error",
             "message": f"Error simulating transaction: {str(e)}",
         }), 500
 
+def _simulate_batch(opportunities: List[Dict[str, Any]]) -> Any:
+    """Simulate a list of opportunities in one vectorised pass.
+    
+    Args:
+        opportunities: Opportunities with ``chain_id``, ``token`` and ``amount`` keys
+        
+    Returns:
+        The endpoint response
+    """
+    chain_ids = [str(o.get("chain_id", "1")) for o in opportunities]
+    
+    # Check if all chains are active
+    inactive = sorted(set(chain_ids) - set(core.workers))
+    if inactive:
+        return jsonify({
+            "status": "error",
+            "message": f"Chains not active: {', '.join(inactive)}",
+        }), 400
+    
+    # Coerce the model inputs, rejecting bad amounts before any work is done
+    has_token: List[bool] = []
+    amounts: List[float] = []
+    for index, opportunity in enumerate(opportunities):
+        try:
+            token, amount = transaction_simulator.opportunity_inputs(opportunity)
+        except ValueError as e:
+            return jsonify({
+                "status": "error",
+                "message": f"opportunities[{index}]: {e}",
+            }), 400
+        has_token.append(token)
+        amounts.append(amount)
+    
+    logger.info("Simulating %d transactions", len(opportunities))
+    
+    batch = transaction_simulator.simulate_transactions_batch(chain_ids, amounts, has_token)
+    
+    results = [
+        {"chain_id": chain_id, **result._asdict()}
+        for chain_id, result in zip(chain_ids, batch.results())
+    ]
+    
+    return jsonify({
+        "status": "success",
+        "message": f"{len(results)} transactions simulated",
+        "results": results,
+    })
+
 # Main function
 async def main() -> int:
     """Main entry point.
@@ -401,17 +715,88 @@ async def main() -> int:
         logger.info("Initialization successful")
         return 0
     except Exception as e:
-        logger.error(f"Error in main: {e}")
+        logger.error("Error in main: %s", e)
         return 1
 
-# Run the app
-if __name__ == "__main__":
-    # Run initialization
-    loop = asyncio.get_event_loop()
-    exit_code = loop.run_until_complete(main())
+def shutdown(timeout: float = API_SHUTDOWN_TIMEOUT) -> None:
+    """Stop the bot, the background loop and the notifier.
     
-    if exit_code != 0:
-        sys.exit(exit_code)
+    Runs when the gunicorn worker exits, so a running bot is stopped
+    cleanly and queued alerts are delivered before the process ends.
+    
+    Args:
+        timeout: Seconds to wait for the bot to stop
+    """
+    global _bg_loop
+    with _bg_loop_lock:
+        loop, _bg_loop = _bg_loop, None
+    
+    if loop is not None:
+        if core is not None:
+            logger.info("Shutting down: stopping bot...")
+            _transition_bot_status((_BotStatus.RUNNING,), _BotStatus.STOPPING)
+            try:
+                asyncio.run_coroutine_threadsafe(stop_core(), loop).result(timeout)
+            except Exception as e:
+                logger.error("Error stopping bot on shutdown: %s", e)
+        loop.call_soon_threadsafe(loop.stop)
     
-    # Run the Flask app
-    app.run(host="0.0.0.0", port=5001)
+    if notifier is not None:
+        notifier.close()
+
+# Production server
+class StandaloneApplication(BaseApplication):
+    """Runs the API under gunicorn when this module is executed directly.
+
+    Initialization happens in ``load()``, i.e. inside the worker process, so
+    the core, the notifier and their threads live where requests are served.
+    Only one worker is used: each worker would hold its own MultiChainCore and
+    nonce state, so concurrency comes from the gthread worker's threads.
+
+    Start the server with ``python app_multi_chain.py``. Pointing the
+    ``gunicorn`` CLI at ``app_multi_chain:app`` skips ``load()``, so the app
+    would serve with ``core`` never initialized.
+    """
+
+    def __init__(self, application: Flask, options: Optional[Dict[str, Any]] = None) -> None:
+        self.application = application
+        self.options = options or {}
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            if key in self.cfg.settings and value is not None:
+                self.cfg.set(key, value)
+
+    def load(self) -> Flask:
+        # Initialize on the loop that will later run the core. The wait is
+        # bounded below gunicorn's worker timeout, so a hung RPC or Vault call
+        # fails the boot (gunicorn halts) rather than the worker being killed
+        # and respawned in a loop.
+        future = asyncio.run_coroutine_threadsafe(main(), _background_loop())
+        try:
+            exit_code = future.result(timeout=API_STARTUP_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise RuntimeError(
+                f"Initialization did not finish within {API_STARTUP_TIMEOUT}s"
+            ) from None
+        if exit_code != 0:
+            # Raising here makes gunicorn halt instead of respawning the worker
+            raise RuntimeError("Initialization failed")
+        return self.application
+
+# Run the app
+if __name__ == "__main__":
+    StandaloneApplication(app, {
+        "bind": f"0.0.0.0:{API_PORT}",
+        "workers": 1,
+        "worker_class": "gthread",
+        "threads": API_THREADS,
+        "keepalive": 5,
+        # load() runs before the worker's first heartbeat
+        "timeout": API_STARTUP_TIMEOUT + 30,
+        # The arbiter kills the worker once graceful_timeout has passed
+        "graceful_timeout": API_SHUTDOWN_TIMEOUT + 10,
+        "worker_exit": lambda server, worker: shutdown(),
+    }).run()
@@ -78,7 +78,7 @@ class ChainWorker:
         self.nonce_lock = asyncio.Lock()
 
         logger.info(
-            f"Initialized ChainWorker for {self.chain_name} (ID: {self.chain_id})")
+            "Initialized ChainWorker for %s (ID: %s)", self.chain_name, self.chain_id)
 
     async def initialize(self) -> bool:
         """Initialize the chain worker.
@@ -89,7 +89,7 @@ class ChainWorker:
         try:
             # Initialize Web3
             logger.info(
-                f"Initializing Web3 for {self.chain_name} with endpoint {self.http_endpoint}")
+                "Initializing Web3 for %s with endpoint %s", self.chain_name, self.http_endpoint)
             self.web3 = Web3(Web3.HTTPProvider(self.http_endpoint))
 
             # Add POA middleware if needed (for networks like Polygon, BSC, etc.)
@@ -98,44 +98,44 @@ class ChainWorker:
             # Check connection
             if not self.web3.is_connected():
                 logger.error(
-                    f"Failed to connect to {self.chain_name} at {self.http_endpoint}")
+                    "Failed to connect to %s at %s", self.chain_name, self.http_endpoint)
                 return False
 
             # Initialize account
             if self.wallet_key:
                 self.account = Account.from_key(self.wallet_key)
-                logger.info(f"Account initialized for {self.chain_name}")
+                logger.info("Account initialized for %s", self.chain_name)
             else:
-                logger.error(f"No wallet key provided for {self.chain_name}")
+                logger.error("No wallet key provided for %s", self.chain_name)
                 return False
 
             # Check wallet balance
             balance = await self.get_wallet_balance()
             self.metrics["wallet_balance_eth"] = balance
-            logger.info(f"Wallet balance on {self.chain_name}: {balance} ETH")
+            logger.info("Wallet balance on %s: %s ETH", self.chain_name, balance)
 
             # Get current nonce
             self.current_nonce = self.web3.eth.get_transaction_count(
                 self.wallet_address)
             logger.info(
-                f"Current nonce for {self.chain_name}: {self.current_nonce}")
+                "Current nonce for %s: %s", self.chain_name, self.current_nonce)
 
             # Get current gas price
             gas_price = await self.get_gas_price()
             self.metrics["last_gas_price_gwei"] = gas_price
             logger.info(
-                f"Current gas price on {self.chain_name}: {gas_price} Gwei")
+                "Current gas price on %s: %s Gwei", self.chain_name, gas_price)
 
             return True
         except Exception as e:
             logger.error(
-                f"Error initializing chain worker for {self.chain_name}: {e}")
+                "Error initializing chain worker for %s: %s", self.chain_name, e)
             return False
 
     async def start(self) -> None:
         """Start the chain worker."""
         self.running = True
-        logger.info(f"Starting chain worker for {self.chain_name}")
+        logger.info("Starting chain worker for %s", self.chain_name)
 
         try:
             # Main loop
@@ -151,18 +151,18 @@ class ChainWorker:
                     await asyncio.sleep(5)
                 except Exception as e:
                     logger.error(
-                        f"Error in main loop for {self.chain_name}: {e}")
+                        "Error in main loop for %s: %s", self.chain_name, e)
                     await asyncio.sleep(10)
         except Exception as e:
-            logger.error(f"Chain worker error for {self.chain_name}: {e}")
+            logger.error("Chain worker error for %s: %s", self.chain_name, e)
             self.running = False
 
-        logger.info(f"Chain worker stopped for {self.chain_name}")
+        logger.info("Chain worker stopped for %s", self.chain_name)
 
     async def stop(self) -> None:
         """Stop the chain worker."""
         self.running = False
-        logger.info(f"Stopping chain worker for {self.chain_name}")
+        logger.info("Stopping chain worker for %s", self.chain_name)
 
     async def get_wallet_balance(self) -> float:
         """Get the wallet balance in ETH.
@@ -176,7 +176,7 @@ class ChainWorker:
             return float(balance_eth)
         except Exception as e:
             logger.error(
-                f"Error getting wallet balance for {self.chain_name}: {e}")
+                "Error getting wallet balance for %s: %s", self.chain_name, e)
             return 0.0
 
     async def get_gas_price(self) -> float:
@@ -190,7 +190,7 @@ class ChainWorker:
             gas_price_gwei = self.web3.from_wei(gas_price_wei, "gwei")
             return float(gas_price_gwei)
         except Exception as e:
-            logger.error(f"Error getting gas price for {self.chain_name}: {e}")
+            logger.error("Error getting gas price for %s: %s", self.chain_name, e)
             return 0.0
 
     async def monitor_opportunities(self) -> None:
@@ -200,10 +200,10 @@ class ChainWorker:
 
         if self.go_live:
             logger.info(
-                f"LIVE MODE: Monitoring for opportunities on {self.chain_name}")
+                "LIVE MODE: Monitoring for opportunities on %s", self.chain_name)
         else:
             logger.info(
-                f"DRY RUN: Would monitor for opportunities on {self.chain_name}")
+                "DRY RUN: Would monitor for opportunities on %s", self.chain_name)
 
     async def update_metrics(self) -> None:
         """Update metrics for this chain."""
@@ -219,7 +219,7 @@ class ChainWorker:
             # Update last block number
             self.metrics["last_block_number"] = self.web3.eth.block_number
         except Exception as e:
-            logger.error(f"Error updating metrics for {self.chain_name}: {e}")
+            logger.error("Error updating metrics for %s: %s", self.chain_name, e)
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get metrics for this chain.
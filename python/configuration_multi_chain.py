@@ -56,6 +56,8 @@ _DEFAULTS: Dict[str, Any] = {
     "VAULT_ADDR": "http://localhost:8200",  # Default Vault address
     "VAULT_TOKEN": "",  # Default empty token
     "VAULT_PATH": "secret/on1builder",  # Default secret path
+    # Notifications
+    "SLACK_WEBHOOK_URL": "",  # Default to no Slack alerts
     # Multi-chain settings
     "CHAINS": "",  # Default to empty string (no chains)
     "CHAIN_ID": "1",  # Default to Ethereum mainnet
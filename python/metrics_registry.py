@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ON1Builder – Metrics Registry
+============================
+Mirrors the multi-chain core metrics as Prometheus gauges.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Set, Tuple
+
+from prometheus_client import CollectorRegistry, Enum, Gauge, generate_latest
+
+logger = logging.getLogger("MetricsRegistry")
+
+# Global (core-wide) fields of MultiChainCore.get_metrics()["global"]
+GLOBAL_FIELDS: Tuple[str, ...] = (
+    "total_chains",
+    "active_chains",
+    "total_transactions",
+    "total_profit_eth",
+    "total_gas_spent_eth",
+    "uptime_seconds",
+)
+
+# Per-chain fields of ChainWorker.get_metrics(); the dashboard queries these names
+CHAIN_FIELDS: Tuple[str, ...] = (
+    "transaction_count",
+    "successful_transactions",
+    "failed_transactions",
+    "total_profit_eth",
+    "total_gas_spent_eth",
+    "last_gas_price_gwei",
+    "wallet_balance_eth",
+    "last_block_number",
+)
+
+CHAIN_LABELS: Tuple[str, ...] = ("chain_id", "chain_name")
+
+BOT_STATES: Tuple[str, ...] = ("stopped", "starting", "running", "stopping", "error")
+
+
+class MetricsRegistry:
+    """Holds pre-registered Prometheus gauges for the core metrics.
+
+    :meth:`update` and :meth:`latest` share a lock, so a scrape never sees
+    a half-applied update.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the registry and register every metric."""
+        self.registry = CollectorRegistry(auto_describe=True)
+        self._lock = threading.Lock()
+        self._chains: Set[Tuple[str, str]] = set()
+
+        # Global totals share names with the per-chain gauges, so prefix them
+        self._global: Dict[str, Gauge] = {
+            name: Gauge(
+                f"core_{name}", f"Core-wide {name.replace('_', ' ')}",
+                registry=self.registry,
+            )
+            for name in GLOBAL_FIELDS
+        }
+        self._chain: Dict[str, Gauge] = {
+            name: Gauge(
+                name, f"Per-chain {name.replace('_', ' ')}", CHAIN_LABELS,
+                registry=self.registry,
+            )
+            for name in CHAIN_FIELDS
+        }
+        self._bot_status = Enum(
+            "bot_status", "Bot status", states=list(BOT_STATES),
+            registry=self.registry,
+        )
+
+    def update(self, metrics: Dict[str, Any]) -> None:
+        """Set every gauge from a ``MultiChainCore.get_metrics()`` result.
+
+        Args:
+            metrics: A dictionary with ``global`` and ``chains`` metrics
+        """
+        global_metrics = metrics.get("global", {})
+        chains = metrics.get("chains", {})
+        with self._lock:
+            for name, gauge in self._global.items():
+                gauge.set(global_metrics.get(name, 0))
+
+            current = {
+                (str(chain_id), str(chain.get("chain_name", "")))
+                for chain_id, chain in chains.items()
+            }
+            if current != self._chains:
+                # Drop series for chains that are no longer running
+                for gauge in self._chain.values():
+                    gauge.clear()
+                self._chains = current
+
+            for chain_id, chain in chains.items():
+                labels = (str(chain_id), str(chain.get("chain_name", "")))
+                for name, gauge in self._chain.items():
+                    gauge.labels(*labels).set(chain.get(name, 0))
+
+    def set_bot_status(self, status: str) -> None:
+        """Set the bot status.
+
+        Args:
+            status: One of BOT_STATES
+        """
+        with self._lock:
+            self._bot_status.state(status)
+
+    def latest(self) -> bytes:
+        """Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            The encoded metrics
+        """
+        with self._lock:
+            return generate_latest(self.registry)
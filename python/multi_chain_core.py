@@ -18,13 +18,15 @@ logger = logging.getLogger("MultiChainCore")
 class MultiChainCore:
     """Core class for managing multiple blockchain operations."""
 
-    def __init__(self, config):
+    def __init__(self, config, metrics_registry=None):
         """Initialize the multi-chain core.
 
         Args:
             config: The global configuration
+            metrics_registry: Optional MetricsRegistry kept in sync by get_metrics
         """
         self.config = config
+        self.metrics_registry = metrics_registry
         self.running = False
         self.workers = {}  # Chain ID -> ChainWorker
 
@@ -47,10 +49,11 @@ class MultiChainCore:
         }
 
         logger.info(
-            f"Initialized MultiChainCore with {len(self.chains_config)} chains")
+            "Initialized MultiChainCore with %d chains", len(self.chains_config))
         for chain in self.chains_config:
             logger.info(
-                f"Configured chain: {chain.get('CHAIN_NAME', 'Unknown')} (ID: {chain.get('CHAIN_ID', 'Unknown')})")
+                "Configured chain: %s (ID: %s)",
+                chain.get("CHAIN_NAME", "Unknown"), chain.get("CHAIN_ID", "Unknown"))
 
     def _parse_chains_config(self) -> List[Dict[str, Any]]:
         """Parse the chains configuration from the global config.
@@ -126,7 +129,7 @@ class MultiChainCore:
             chain_name = chain_config.get("CHAIN_NAME", f"chain-{chain_id}")
 
             logger.info(
-                f"Initializing worker for {chain_name} (ID: {chain_id})")
+                "Initializing worker for %s (ID: %s)", chain_name, chain_id)
 
             # Create and initialize worker
             worker = ChainWorker(chain_config, global_config)
@@ -135,9 +138,9 @@ class MultiChainCore:
             if success:
                 self.workers[chain_id] = worker
                 logger.info(
-                    f"Worker for {chain_name} initialized successfully")
+                    "Worker for %s initialized successfully", chain_name)
             else:
-                logger.error(f"Failed to initialize worker for {chain_name}")
+                logger.error("Failed to initialize worker for %s", chain_name)
 
         # Update active chains count
         self.metrics["active_chains"] = len(self.workers)
@@ -152,7 +155,7 @@ class MultiChainCore:
             return
 
         self.running = True
-        logger.info(f"Starting {len(self.workers)} chain workers")
+        logger.info("Starting %d chain workers", len(self.workers))
 
         # Start all workers
         worker_tasks = []
@@ -173,7 +176,7 @@ class MultiChainCore:
             for chain_id, worker in self.workers.items():
                 await worker.stop()
         except Exception as e:
-            logger.error(f"Error in MultiChainCore: {e}")
+            logger.error("Error in MultiChainCore: %s", e)
             self.running = False
             # Stop all workers
             for chain_id, worker in self.workers.items():
@@ -214,7 +217,7 @@ class MultiChainCore:
                 # Sleep for a bit
                 await asyncio.sleep(10)
             except Exception as e:
-                logger.error(f"Error updating metrics: {e}")
+                logger.error("Error updating metrics: %s", e)
                 await asyncio.sleep(30)
 
     def get_metrics(self) -> Dict[str, Any]:
@@ -233,4 +236,7 @@ class MultiChainCore:
         for chain_id, worker in self.workers.items():
             metrics["chains"][chain_id] = worker.get_metrics()
 
+        if self.metrics_registry is not None:
+            self.metrics_registry.update(metrics)
+
         return metrics
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ON1Builder – Slack Notifier
+==========================
+Sends alerts to a Slack incoming webhook from a background dispatcher thread.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+import orjson
+from cachetools import TTLCache
+
+logger = logging.getLogger("SlackNotifier")
+
+# Attachment colours per alert level
+ALERT_COLORS: Dict[str, str] = {
+    "INFO": "#36a64f",
+    "WARNING": "#ffcc00",
+    "ERROR": "#ff0000",
+    "CRITICAL": "#8b0000",
+}
+DEFAULT_ALERT_COLOR: str = ALERT_COLORS["INFO"]
+
+# Rate-limit bucket shared by every level not in ALERT_COLORS
+OTHER_LEVEL_BUCKET: str = "OTHER"
+
+# Headers for the pre-encoded webhook body
+_JSON_HEADERS: Dict[str, str] = {"Content-Type": "application/json"}
+_GZIP_JSON_HEADERS: Dict[str, str] = {**_JSON_HEADERS, "Content-Encoding": "gzip"}
+
+# Responses worth retrying after a short backoff
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Sentinel telling the dispatcher worker to exit
+_STOP = object()
+
+
+class AlertDispatcher:
+    """Delivers queued alert items in batches from a worker thread."""
+
+    def __init__(
+        self,
+        post: Callable[[List[Any]], None],
+        maxsize: int = 1000,
+        max_batch: int = 20,
+        batch_window: float = 0.05,
+    ) -> None:
+        """Initialize the dispatcher and start its worker thread.
+
+        Args:
+            post: Callable delivering one batch of items; exceptions are logged
+            maxsize: Maximum number of queued items before new ones are dropped
+            max_batch: Maximum number of items delivered in one batch
+            batch_window: Seconds to wait for more items after the first one
+        """
+        self._post = post
+        self._max_batch = max_batch
+        self._batch_window = batch_window
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(
+            target=self._run, name="AlertDispatcher", daemon=True
+        )
+        self._thread.start()
+
+    def enqueue(self, item: Any) -> bool:
+        """Queue an item for delivery without blocking.
+
+        Args:
+            item: The item to deliver
+
+        Returns:
+            True if the item was queued, False if the queue is full
+        """
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            logger.warning("Alert queue full, dropping alert")
+            return False
+
+    def flush(self) -> None:
+        """Block until every queued item has been delivered."""
+        self._queue.join()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Deliver the remaining items and stop the worker thread.
+
+        Args:
+            timeout: Seconds to wait for the worker to finish
+        """
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _next_batch(self) -> Tuple[List[Any], bool]:
+        """Collect up to max_batch items, waiting at most batch_window after the first.
+
+        Returns:
+            A tuple of (items, stop_requested)
+        """
+        item = self._queue.get()
+        if item is _STOP:
+            return [], True
+
+        batch = [item]
+        deadline = time.monotonic() + self._batch_window
+        while len(batch) < self._max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        """Worker loop: post one batch per iteration until stopped."""
+        stop = False
+        while not stop:
+            batch, stop = self._next_batch()
+            try:
+                if batch:
+                    self._post(batch)
+            except Exception as e:
+                logger.error("Error sending %d Slack alert(s): %s", len(batch), e)
+            finally:
+                # One task_done per item taken, including the stop sentinel
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+
+
+class SlackNotifier:
+    """Sends alerts to Slack over a pooled HTTP/2 client.
+
+    ``send`` only queues the alert; the HTTP round trip happens on the
+    dispatcher thread so callers never block on Slack.
+    """
+
+    REQUEST_TIMEOUT: float = 10.0  # seconds
+    WARM_UP_TIMEOUT: float = 2.0  # seconds
+    MAX_RETRIES: int = 2  # retries for _RETRY_STATUSES responses
+    RETRY_BACKOFF: float = 0.2  # seconds, doubled per retry
+    RATE_WINDOW: float = 60.0  # seconds
+
+    def __init__(
+        self,
+        webhook_url: Optional[str],
+        queue_size: int = 1000,
+        dedup_ttl: int = 7200,
+        max_per_minute: int = 30,
+        gzip_min_bytes: Optional[int] = None,
+    ) -> None:
+        """Initialize the notifier.
+
+        Args:
+            webhook_url: The Slack incoming webhook URL. Alerts are dropped
+                when this is empty.
+            queue_size: Maximum number of alerts waiting for delivery
+            dedup_ttl: Seconds during which an identical alert is suppressed
+            max_per_minute: Maximum number of alerts sent per bucket per minute
+            gzip_min_bytes: Request bodies larger than this are gzip-compressed;
+                None (the default) disables compression. Only enable it for
+                an endpoint known to accept gzip request bodies.
+        """
+        self.webhook_url = webhook_url or ""
+        self.max_per_minute = max_per_minute
+        self.gzip_min_bytes = gzip_min_bytes
+
+        # Suppression state shared by every caller of send()
+        self._lock = threading.Lock()
+        self._seen: TTLCache = TTLCache(maxsize=4096, ttl=dedup_ttl)
+        self._sent_at: Dict[str, Deque[float]] = {}
+
+        # One client for the lifetime of the process. HTTP/2 multiplexes
+        # every alert batch over a single kept-alive TLS connection to Slack.
+        self._client = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=2,  # connection failures only
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+            ),
+            timeout=self.REQUEST_TIMEOUT,
+        )
+
+        # Queued items are (dedup key, attachment) pairs
+        self._dispatcher = AlertDispatcher(self._deliver, maxsize=queue_size)
+
+        # Attachment keys that never change between alerts
+        self._base_attachment: Dict[str, str] = {
+            "pretext": "ON1Builder Alert",
+            "footer": "ON1Builder",
+        }
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a webhook URL is configured."""
+        return bool(self.webhook_url)
+
+    def send(
+        self,
+        message: str,
+        level: str = "INFO",
+        details: Optional[Dict[str, Any]] = None,
+        dedup: bool = True,
+        rate_bucket: Optional[str] = None,
+    ) -> bool:
+        """Queue an alert for delivery to Slack.
+
+        Alerts identical to one sent within the dedup TTL, and alerts beyond
+        the per-bucket rate limit, are suppressed. An alert whose delivery
+        fails is not counted as sent, so it can be retried immediately.
+
+        Args:
+            message: The alert message
+            level: The alert level (INFO, WARNING, ERROR or CRITICAL)
+            details: Optional key/value pairs shown as attachment fields
+            dedup: Whether to suppress duplicates of this alert
+            rate_bucket: Rate-limit bucket to charge; defaults to the level,
+                or OTHER_LEVEL_BUCKET for levels not in ALERT_COLORS
+
+        Returns:
+            True if the alert was queued, False otherwise
+        """
+        if not self.enabled:
+            logger.warning("SLACK_WEBHOOK_URL not set, dropping alert: %s", message)
+            return False
+
+        level = level.upper()
+        details = dict(details or {})
+        if rate_bucket is None:
+            rate_bucket = level if level in ALERT_COLORS else OTHER_LEVEL_BUCKET
+
+        key = self._dedup_key(level, message, details) if dedup else None
+        with self._lock:
+            if key is not None and key in self._seen:
+                logger.debug("Suppressing duplicate alert: %s", message)
+                return False
+            if not self._allow(rate_bucket):
+                logger.warning("Alert rate limit reached for %s, dropping alert: %s", rate_bucket, message)
+                return False
+            if key is not None:
+                self._seen[key] = True
+
+        ts = time.time_ns() // 1_000_000_000
+        if "timestamp" not in details:
+            details["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
+
+        title = f"[{level}] {message}"
+        attachment = {
+            **self._base_attachment,
+            "fallback": title,
+            "color": ALERT_COLORS.get(level, DEFAULT_ALERT_COLOR),
+            "title": title,
+            "fields": [
+                {"title": name, "value": str(value), "short": True}
+                for name, value in details.items()
+            ],
+            "ts": ts,
+        }
+
+        if not self._dispatcher.enqueue((key, attachment)):
+            # Not delivered, so a retry must not be treated as a duplicate
+            self._release([key])
+            return False
+        return True
+
+    def warm_up(self) -> None:
+        """Open a pooled connection to the webhook host ahead of the first alert.
+
+        DNS resolution, the TCP connect and the TLS handshake happen here
+        rather than in front of the first real alert. Failures are ignored;
+        the first send simply connects as usual.
+        """
+        if not self.enabled:
+            return
+        parts = urlsplit(self.webhook_url)
+        try:
+            self._client.head(
+                f"{parts.scheme}://{parts.netloc}/", timeout=self.WARM_UP_TIMEOUT
+            )
+        except Exception as e:
+            logger.debug("Slack connection warm-up failed: %s", e)
+
+    def flush(self) -> None:
+        """Block until every queued alert has been delivered."""
+        self._dispatcher.flush()
+
+    def close(self) -> None:
+        """Deliver queued alerts, then close the pooled HTTP client."""
+        self._dispatcher.close()
+        self._client.close()
+
+    @staticmethod
+    def _dedup_key(level: str, message: str, details: Dict[str, Any]) -> str:
+        """Build the key identifying an alert for deduplication.
+
+        Args:
+            level: The alert level
+            message: The alert message
+            details: The alert details
+
+        Returns:
+            The MD5 hex digest of the alert contents
+        """
+        blob = json.dumps(
+            {"l": level, "m": message, "d": details}, sort_keys=True, default=str
+        )
+        return hashlib.md5(blob.encode()).hexdigest()
+
+    def _allow(self, bucket: str) -> bool:
+        """Record a send for ``bucket`` if it is within the rate limit.
+
+        Must be called with ``self._lock`` held.
+
+        Args:
+            bucket: The rate-limit bucket
+
+        Returns:
+            True if the alert may be sent, False if the limit is reached
+        """
+        now = time.monotonic()
+        window = self._sent_at.setdefault(bucket, deque())
+        while window and now - window[0] >= self.RATE_WINDOW:
+            window.popleft()
+        if len(window) >= self.max_per_minute:
+            return False
+        window.append(now)
+        return True
+
+    def _release(self, keys: List[Optional[str]]) -> None:
+        """Forget the dedup keys of alerts that were not delivered.
+
+        Args:
+            keys: The dedup keys; None entries are ignored
+        """
+        with self._lock:
+            for key in keys:
+                if key is not None:
+                    self._seen.pop(key, None)
+
+    def _deliver(self, items: List[Tuple[Optional[str], Dict[str, Any]]]) -> None:
+        """Post a batch of queued alerts (runs on the dispatcher thread).
+
+        Args:
+            items: (dedup key, attachment) pairs
+
+        Raises:
+            Exception: Whatever :meth:`_post` raised, after releasing the keys
+        """
+        try:
+            self._post([attachment for _, attachment in items])
+        except Exception:
+            self._release([key for key, _ in items])
+            raise
+
+    def _post(self, attachments: List[Dict[str, Any]]) -> None:
+        """POST a batch of alerts as one message (runs on the dispatcher thread).
+
+        Args:
+            attachments: One Slack attachment per alert
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        body = orjson.dumps({"attachments": attachments})
+        headers = _JSON_HEADERS
+        if self.gzip_min_bytes is not None and len(body) > self.gzip_min_bytes:
+            body = gzip.compress(body, compresslevel=1)
+            headers = _GZIP_JSON_HEADERS
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            response = self._client.post(self.webhook_url, content=body, headers=headers)
+            if response.status_code not in _RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                break
+            time.sleep(self.RETRY_BACKOFF * 2 ** attempt)
+        response.raise_for_status()
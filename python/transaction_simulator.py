@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ON1Builder – Transaction Simulator
+=================================
+Estimates gas cost and profit for trading opportunities, either one at a
+time or as a vectorised batch over NumPy arrays.
+"""
+
+import functools
+import logging
+import math
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("TransactionSimulator")
+
+# Gas model
+BASE_GAS_USED: int = 100_000
+TOKEN_GAS_EXTRA: int = 50_000  # extra gas for ERC20 transfers/approvals
+DEFAULT_GAS_PRICE_GWEI: int = 20
+
+# Gas price per chain ID; chains not listed use DEFAULT_GAS_PRICE_GWEI
+GAS_PRICE_GWEI: Dict[str, int] = {
+    "1": 20,  # Ethereum Mainnet
+    "137": 50,  # Polygon Mainnet
+    "42161": 20,  # Arbitrum One
+    "10": 20,  # Optimism
+}
+
+# Profit model
+DEFAULT_AMOUNT_ETH: float = 1.0
+PROFIT_MARGIN: float = 0.005  # expected profit as a fraction of the amount
+
+GWEI_TO_ETH: float = 1e-9
+
+
+class SimResult(NamedTuple):
+    """Outcome of simulating one opportunity."""
+
+    success: bool  # estimated profit exceeds estimated cost
+    gas_used: int
+    gas_price_gwei: int
+    estimated_cost_eth: float
+    estimated_profit_eth: float
+
+
+@dataclass(slots=True)
+class SimBatch:
+    """Outcome of simulating many opportunities, one array per field.
+
+    Callers can filter with array masks (e.g. ``batch.success``) and only
+    build per-opportunity objects via :meth:`results` at the API boundary.
+    """
+
+    success: np.ndarray
+    gas_used: np.ndarray
+    gas_price_gwei: np.ndarray
+    estimated_cost_eth: np.ndarray
+    estimated_profit_eth: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.success)
+
+    def results(self) -> List[SimResult]:
+        """Convert the batch to one SimResult per opportunity.
+
+        Returns:
+            The per-opportunity results, in input order
+        """
+        columns = [getattr(self, f.name).tolist() for f in fields(self)]
+        return [SimResult(*row) for row in zip(*columns)]
+
+
+@functools.lru_cache(maxsize=4096)
+def _sim_kernel(chain_id: str, has_token: bool, amount: float) -> SimResult:
+    """Apply the gas and profit model.
+
+    Pure function of its arguments, so repeated simulations of the same
+    opportunity are served from the cache. Call ``_sim_kernel.cache_clear()``
+    after changing the gas model constants.
+
+    Args:
+        chain_id: The chain the opportunity is on
+        has_token: Whether the opportunity involves a token
+        amount: The amount (ETH)
+
+    Returns:
+        The simulation result
+    """
+    gas_used = BASE_GAS_USED + (TOKEN_GAS_EXTRA if has_token else 0)
+    gas_price_gwei = GAS_PRICE_GWEI.get(chain_id, DEFAULT_GAS_PRICE_GWEI)
+    cost_eth = gas_used * gas_price_gwei * GWEI_TO_ETH
+    profit_eth = amount * PROFIT_MARGIN
+    return SimResult(profit_eth > cost_eth, gas_used, gas_price_gwei, cost_eth, profit_eth)
+
+
+def opportunity_inputs(opportunity: Dict[str, Any]) -> Tuple[bool, float]:
+    """Extract the model inputs from an opportunity.
+
+    Args:
+        opportunity: The opportunity; ``token`` and ``amount`` (ETH) are used
+
+    Returns:
+        A tuple of (has_token, amount)
+
+    Raises:
+        ValueError: If ``amount`` is not a finite number
+    """
+    raw_amount = opportunity.get("amount", DEFAULT_AMOUNT_ETH)
+    try:
+        amount = float(raw_amount)
+    except (TypeError, ValueError):
+        amount = math.nan
+    if not math.isfinite(amount):
+        raise ValueError(f"amount must be a number, got {raw_amount!r}")
+    return bool(opportunity.get("token")), amount
+
+
+def _compute_sim(chain_id: str, opportunity: Dict[str, Any]) -> SimResult:
+    """Simulate a single opportunity through the cached kernel.
+
+    Args:
+        chain_id: The chain the opportunity is on
+        opportunity: The opportunity; ``token`` and ``amount`` (ETH) are used
+
+    Returns:
+        The simulation result
+
+    Raises:
+        ValueError: If ``amount`` is not a finite number
+    """
+    return _sim_kernel(chain_id, *opportunity_inputs(opportunity))
+
+
+def simulate_transaction(chain_id: str, opportunity: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate a single opportunity.
+
+    Args:
+        chain_id: The chain the opportunity is on
+        opportunity: The opportunity; ``token`` and ``amount`` (ETH) are used
+
+    Returns:
+        A dictionary with the fields of :class:`SimResult`
+
+    Raises:
+        ValueError: If ``amount`` is not a finite number
+    """
+    logger.debug("Simulating transaction on chain %s", chain_id)
+    return _compute_sim(chain_id, opportunity)._asdict()
+
+
+def simulate_transactions_batch(
+    chain_ids: Sequence[str],
+    amounts: Sequence[float],
+    has_token: Sequence[bool],
+) -> SimBatch:
+    """Simulate many opportunities at once.
+
+    Computes the same model as :func:`simulate_transaction` with NumPy
+    vector operations, one array element per opportunity.
+
+    Args:
+        chain_ids: The chain of each opportunity
+        amounts: The amount (ETH) of each opportunity
+        has_token: Whether each opportunity involves a token
+
+    Returns:
+        The batch result, one array per field
+    """
+    chain_arr = np.asarray(chain_ids).astype(str)
+    amount_arr = np.asarray(amounts, dtype=np.float64)
+    token_arr = np.asarray(has_token, dtype=bool)
+    logger.debug("Simulating %d transactions", len(chain_arr))
+
+    gas_used = BASE_GAS_USED + TOKEN_GAS_EXTRA * token_arr.astype(np.int64)
+
+    # One table lookup per distinct chain, then a gather for every element
+    unique_chains, chain_index = np.unique(chain_arr, return_inverse=True)
+    chain_prices = np.array(
+        [GAS_PRICE_GWEI.get(c, DEFAULT_GAS_PRICE_GWEI) for c in unique_chains],
+        dtype=np.int64,
+    )
+    gas_price_gwei = chain_prices[chain_index]
+    cost_eth = gas_used * gas_price_gwei * GWEI_TO_ETH
+    profit_eth = amount_arr * PROFIT_MARGIN
+
+    return SimBatch(
+        success=profit_eth > cost_eth,
+        gas_used=gas_used,
+        gas_price_gwei=gas_price_gwei,
+        estimated_cost_eth=cost_eth,
+        estimated_profit_eth=profit_eth,
+    )
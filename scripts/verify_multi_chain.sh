@@ -82,7 +82,7 @@ echo "Metrics endpoint is accessible"
 
 # Check if metrics show data for all chains
 echo "Checking metrics for all chains..."
-METRICS_RESPONSE=$(curl -s http://localhost:5001/metrics)
+METRICS_RESPONSE=$(curl -s http://localhost:5001/api/metrics)
 IFS=',' read -ra CHAIN_ARRAY <<< "$CHAINS"
 for chain_id in "${CHAIN_ARRAY[@]}"; do
     if ! echo "$METRICS_RESPONSE" | grep -q "\"chain_id\":\"$chain_id\""; then
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the multi-chain API server.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import importlib
+import sys
+import os
+import threading
+import time
+
+# The API server uses flat imports from the python directory
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "python"))
+
+from python.slack_notifier import SlackNotifier
+
+
+@pytest.fixture(scope="module")
+def app_module(tmp_path_factory):
+    """Import the API server with its log file in a temporary directory."""
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("app"))
+    try:
+        return importlib.import_module("app_multi_chain")
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture
+def client(app_module, monkeypatch):
+    """Create a test client backed by a mocked core and notifier."""
+    core = MagicMock()
+    core.workers = {"1": MagicMock()}
+    notifier = SlackNotifier("https://hooks.slack.com/services/T000/B000/XXXX")
+    notifier._client = MagicMock()
+
+    monkeypatch.setattr(app_module, "core", core)
+    monkeypatch.setattr(app_module, "notifier", notifier)
+    app_module._set_bot_status(app_module._BotStatus.STOPPED)
+    yield app_module.app.test_client()
+    notifier.close()
+
+
+def test_test_alert_can_repeat(client):
+    """Test that identical test alerts are not suppressed as duplicates."""
+    for _ in range(2):
+        response = client.post("/api/test-alert", json={"message": "ping"})
+        assert response.status_code == 200
+        assert response.get_json()["message"] == "Test alert queued"
+
+
+def test_test_alert_rejects_non_string_level(client):
+    """Test that a non-string level is a client error."""
+    response = client.post("/api/test-alert", json={"level": 3})
+
+    assert response.status_code == 400
+    assert response.get_json()["message"] == "level must be a string"
+
+
+def test_test_alert_rejects_unknown_level(client):
+    """Test that only the known alert levels are accepted."""
+    response = client.post("/api/test-alert", json={"level": "LOUD"})
+
+    assert response.status_code == 400
+    assert response.get_json()["message"] == "level must be one of INFO, WARNING, ERROR, CRITICAL"
+
+
+def test_test_alerts_do_not_spend_level_budget(app_module, client):
+    """Test that test alerts are rate limited apart from real alerts."""
+    app_module.notifier.max_per_minute = 1
+
+    assert client.post("/api/test-alert", json={"level": "critical"}).status_code == 200
+    assert client.post("/api/test-alert", json={"level": "CRITICAL"}).status_code == 429
+    assert app_module.notifier.send("Wallet drained", "CRITICAL") is True
+
+
+def wait_for_status(app_module, name, timeout=5.0):
+    """Wait until the bot reaches the named status."""
+    deadline = time.monotonic() + timeout
+    while app_module._STATUS_NAME[app_module._status[0]] != name:
+        assert time.monotonic() < deadline, f"bot never reached {name}"
+        time.sleep(0.01)
+
+
+def test_start_stop_state_machine(app_module, client):
+    """Test the start/stop transitions, including a slow shutdown."""
+    unwound = threading.Event()
+
+    async def run():
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            # Like MultiChainCore.run: stop the workers, then return
+            await asyncio.sleep(0.2)
+            unwound.set()
+
+    app_module.core.run = run
+    app_module.core.stop = AsyncMock()
+
+    assert client.post("/stop").status_code == 400
+    assert client.post("/start").status_code == 200
+    wait_for_status(app_module, "running")
+    assert client.post("/start").get_json()["message"] == "Bot is already running"
+
+    assert client.post("/stop").status_code == 200
+    time.sleep(0.05)
+    # The old run is still unwinding, so a new start must be refused
+    assert app_module._STATUS_NAME[app_module._status[0]] == "stopping"
+    assert client.post("/start").get_json()["message"] == "Bot is already stopping"
+
+    wait_for_status(app_module, "stopped")
+    assert unwound.is_set()
+    app_module.core.stop.assert_awaited_once()
+
+    assert client.post("/start").status_code == 200
+    wait_for_status(app_module, "running")
+    assert client.post("/stop").status_code == 200
+    wait_for_status(app_module, "stopped")
+
+
+def test_response_cache_reuses_body(app_module):
+    """Test that the cached response is reused until the TTL or invalidation."""
+    compute = MagicMock(return_value=({"status": "ok"}, 503))
+    cache = app_module._ResponseCache(ttl_ns=60_000_000_000)
+
+    first = cache.get(compute)
+    second = cache.get(compute)
+    assert compute.call_count == 1
+    assert first.status_code == second.status_code == 503
+    assert second.get_data() == b'{"status":"ok"}'
+
+    cache.invalidate()
+    cache.get(compute)
+    assert compute.call_count == 2
+
+
+def test_response_cache_expires(app_module):
+    """Test that a zero TTL recomputes on every request."""
+    compute = MagicMock(return_value=({"status": "ok"}, 200))
+    cache = app_module._ResponseCache(ttl_ns=0)
+
+    cache.get(compute)
+    cache.get(compute)
+    assert compute.call_count == 2
+
+
+def test_prometheus_metrics(app_module, client):
+    """Test that /metrics serves the registry refreshed from the core."""
+    app_module.core.get_metrics.side_effect = lambda: app_module.metrics_registry.update({
+        "global": {"active_chains": 1},
+        "chains": {"1": {"chain_name": "Ethereum Mainnet", "transaction_count": 7}},
+    })
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain")
+    assert b'transaction_count{chain_id="1",chain_name="Ethereum Mainnet"} 7.0' in response.data
+
+
+def test_prometheus_metrics_without_core(app_module, client, monkeypatch):
+    """Test that /metrics fails while the core is not initialized."""
+    monkeypatch.setattr(app_module, "core", None)
+
+    assert client.get("/metrics").status_code == 503
+
+
+def test_simulate_single(client):
+    """Test simulating one opportunity."""
+    response = client.post("/api/simulate-transaction", json={"chain_id": "1", "amount": 2})
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["chain_id"] == "1"
+    assert body["result"]["gas_used"] == 100000
+    assert body["result"]["estimated_profit_eth"] == pytest.approx(0.01)
+
+
+def test_simulate_batch(client):
+    """Test simulating a list of opportunities."""
+    response = client.post("/api/simulate-transaction", json={"opportunities": [
+        {"chain_id": "1"},
+        {"chain_id": "1", "token": "0xToken", "amount": "0.5"},
+    ]})
+
+    assert response.status_code == 200
+    results = response.get_json()["results"]
+    assert [r["gas_used"] for r in results] == [100000, 150000]
+    assert results[1]["chain_id"] == "1"
+
+
+@pytest.mark.parametrize("body, message", [
+    ({"chain_id": "137"}, "Chain 137 is not active"),
+    ({"opportunities": [{"chain_id": "1"}, {"chain_id": "137"}]}, "Chains not active: 137"),
+])
+def test_simulate_inactive_chain(client, body, message):
+    """Test that simulations on inactive chains are rejected."""
+    response = client.post("/api/simulate-transaction", json=body)
+
+    assert response.status_code == 400
+    assert response.get_json()["message"] == message
+
+
+@pytest.mark.parametrize("body, message", [
+    ({"opportunities": "1"}, "opportunities must be a list of objects"),
+    ({"opportunities": {"chain_id": "1"}}, "opportunities must be a list of objects"),
+    ({"opportunities": [{"chain_id": "1"}, 5]}, "opportunities must be a list of objects"),
+    ({"opportunities": [{"amount": "lots"}]}, "opportunities[0]: amount must be a number, got 'lots'"),
+    ({"amount": "lots"}, "amount must be a number, got 'lots'"),
+])
+def test_simulate_malformed_input(client, body, message):
+    """Test that malformed simulation input is a client error."""
+    response = client.post("/api/simulate-transaction", json=body)
+
+    assert response.status_code == 400
+    assert response.get_json()["message"] == message
+
+
+def test_shutdown_stops_bot_and_notifier(app_module, client):
+    """Test that worker shutdown stops a running bot and flushes alerts."""
+    unwound = threading.Event()
+
+    async def run():
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            unwound.set()
+
+    app_module.core.run = run
+    app_module.core.stop = AsyncMock()
+    assert client.post("/start").status_code == 200
+    wait_for_status(app_module, "running")
+    loop = app_module._background_loop()
+    app_module.notifier.send("queued before shutdown")
+
+    app_module.shutdown()
+
+    assert unwound.is_set()
+    app_module.core.stop.assert_awaited_once()
+    assert app_module._STATUS_NAME[app_module._status[0]] == "stopped"
+    app_module.notifier._client.post.assert_called_once()
+    assert app_module._bg_loop is None
+    wait_until = time.monotonic() + 5
+    while loop.is_running():
+        assert time.monotonic() < wait_until
+        time.sleep(0.01)
+
+
+def test_initialize_warms_slack_after_core(app_module, monkeypatch):
+    """Test that the Slack connection is warmed only after the core is up."""
+    calls = []
+    core = MagicMock()
+    core.initialize = AsyncMock(side_effect=lambda: calls.append("core") or True)
+    notifier = MagicMock()
+    notifier.warm_up.side_effect = lambda: calls.append("warm_up")
+    monkeypatch.setattr(app_module, "MultiChainConfiguration", MagicMock())
+    monkeypatch.setattr(app_module, "MultiChainCore", MagicMock(return_value=core))
+    monkeypatch.setattr(app_module, "SlackNotifier", MagicMock(return_value=notifier))
+    for name in ("config", "core", "notifier"):
+        monkeypatch.setattr(app_module, name, None)
+
+    assert asyncio.run(app_module.initialize()) is True
+    assert calls == ["core", "warm_up"]
+
+
+def test_initialize_failure_skips_warm_up(app_module, monkeypatch):
+    """Test that a failed core initialization does not connect to Slack."""
+    core = MagicMock()
+    core.initialize = AsyncMock(return_value=False)
+    notifier = MagicMock()
+    monkeypatch.setattr(app_module, "MultiChainConfiguration", MagicMock())
+    monkeypatch.setattr(app_module, "MultiChainCore", MagicMock(return_value=core))
+    monkeypatch.setattr(app_module, "SlackNotifier", MagicMock(return_value=notifier))
+    for name in ("config", "core", "notifier"):
+        monkeypatch.setattr(app_module, name, None)
+
+    assert asyncio.run(app_module.initialize()) is False
+    notifier.warm_up.assert_not_called()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the MetricsRegistry class.
+"""
+
+from python.metrics_registry import MetricsRegistry
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def core_metrics():
+    """Create a MultiChainCore.get_metrics() result."""
+    return {
+        "global": {
+            "total_chains": 2,
+            "active_chains": 2,
+            "total_transactions": 30,
+            "total_profit_eth": 0.08,
+            "total_gas_spent_eth": 0.03,
+            "start_time": 1700000000.0,
+            "uptime_seconds": 3600,
+        },
+        "chains": {
+            "1": {
+                "chain_id": "1",
+                "chain_name": "Ethereum Mainnet",
+                "transaction_count": 10,
+                "total_profit_eth": 0.05,
+                "wallet_balance_eth": 1.5,
+            },
+            "137": {
+                "chain_id": "137",
+                "chain_name": "Polygon Mainnet",
+                "transaction_count": 20,
+                "total_profit_eth": 0.03,
+            },
+        },
+    }
+
+
+def test_update_sets_gauges(core_metrics):
+    """Test that global and per-chain gauges mirror the core metrics."""
+    registry = MetricsRegistry()
+    registry.update(core_metrics)
+    sample = registry.registry.get_sample_value
+
+    assert sample("core_active_chains") == 2
+    assert sample("core_total_profit_eth") == 0.08
+    assert sample("transaction_count", {"chain_id": "1", "chain_name": "Ethereum Mainnet"}) == 10
+    assert sample("total_profit_eth", {"chain_id": "137", "chain_name": "Polygon Mainnet"}) == 0.03
+    assert sample("wallet_balance_eth", {"chain_id": "137", "chain_name": "Polygon Mainnet"}) == 0
+
+
+def test_removed_chain_is_dropped(core_metrics):
+    """Test that series for a chain no longer reported are removed."""
+    registry = MetricsRegistry()
+    registry.update(core_metrics)
+    del core_metrics["chains"]["137"]
+    registry.update(core_metrics)
+
+    output = registry.latest().decode()
+    assert 'chain_id="1"' in output
+    assert 'chain_id="137"' not in output
+
+
+def test_bot_status(core_metrics):
+    """Test that the bot status is exported as a state set."""
+    registry = MetricsRegistry()
+    registry.set_bot_status("running")
+    sample = registry.registry.get_sample_value
+
+    assert sample("bot_status", {"bot_status": "running"}) == 1
+    assert sample("bot_status", {"bot_status": "stopped"}) == 0
+
+
+def test_latest_text_format(core_metrics):
+    """Test that latest renders the Prometheus text exposition format."""
+    registry = MetricsRegistry()
+    registry.update(core_metrics)
+
+    output = registry.latest().decode()
+    assert "# TYPE transaction_count gauge" in output
+    assert 'transaction_count{chain_id="1",chain_name="Ethereum Mainnet"} 10.0' in output
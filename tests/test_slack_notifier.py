@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the SlackNotifier class.
+"""
+
+from python.slack_notifier import AlertDispatcher, SlackNotifier, ALERT_COLORS
+import gzip
+import orjson
+import pytest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+import threading
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WEBHOOK_URL = "https://hooks.slack.com/services/T000/B000/XXXX"
+
+
+@pytest.fixture
+def notifier():
+    """Create a SlackNotifier with a mocked HTTP session."""
+    notifier = SlackNotifier(WEBHOOK_URL)
+    notifier._client = MagicMock()
+    return notifier
+
+
+def test_client_is_reused(notifier):
+    """Test that every alert goes through the same pooled client."""
+    assert notifier.send("first") is True
+    notifier.flush()
+    assert notifier.send("second", "ERROR") is True
+    notifier.flush()
+
+    assert notifier._client.post.call_count == 2
+    for call in notifier._client.post.call_args_list:
+        assert call.args[0] == WEBHOOK_URL
+
+
+def test_client_uses_http2():
+    """Test that the client pools connections over HTTP/2."""
+    with patch("python.slack_notifier.httpx.HTTPTransport") as transport:
+        notifier = SlackNotifier(WEBHOOK_URL)
+
+    assert transport.call_args.kwargs["http2"] is True
+    notifier.close()
+
+
+def test_send_payload(notifier):
+    """Test the attachment built for an alert."""
+    notifier.send("Gas spike", "warning", {"chain_id": "1"})
+    notifier.flush()
+
+    payload = orjson.loads(notifier._client.post.call_args.kwargs["content"])
+    attachment = payload["attachments"][0]
+    assert attachment["title"] == "[WARNING] Gas spike"
+    assert attachment["color"] == ALERT_COLORS["WARNING"]
+    assert {"title": "chain_id", "value": "1", "short": True} in attachment["fields"]
+
+
+def test_send_without_webhook():
+    """Test that alerts are dropped when no webhook is configured."""
+    notifier = SlackNotifier("")
+    notifier._client = MagicMock()
+
+    assert notifier.send("dropped") is False
+    notifier.flush()
+    notifier._client.post.assert_not_called()
+
+
+def test_send_does_not_block(notifier):
+    """Test that send returns before the HTTP request completes."""
+    release = threading.Event()
+    notifier._client.post.side_effect = lambda *args, **kwargs: release.wait(5)
+
+    assert notifier.send("slow") is True
+    release.set()
+    notifier.flush()
+    notifier._client.post.assert_called_once()
+
+
+def test_http_error_keeps_worker_alive(notifier):
+    """Test that a failed POST does not stop later alerts."""
+    notifier._client.post.return_value.raise_for_status.side_effect = [Exception("boom"), None]
+
+    notifier.send("failed")
+    notifier.flush()
+    notifier.send("delivered")
+    notifier.flush()
+
+    assert notifier._client.post.call_count == 2
+
+
+def test_failed_alert_can_be_resent(notifier):
+    """Test that an alert whose POST fails is not suppressed as a duplicate."""
+    notifier._client.post.return_value.raise_for_status.side_effect = [Exception("boom"), None]
+
+    assert notifier.send("Wallet drained", "CRITICAL") is True
+    notifier.flush()
+    assert notifier.send("Wallet drained", "CRITICAL") is True
+    notifier.flush()
+
+    assert notifier._client.post.call_count == 2
+    # Delivered this time, so the next copy is a duplicate
+    assert notifier.send("Wallet drained", "CRITICAL") is False
+
+
+def test_send_without_dedup(notifier):
+    """Test that dedup=False alerts are never suppressed as duplicates."""
+    assert notifier.send("ping", dedup=False) is True
+    assert notifier.send("ping", dedup=False) is True
+    notifier.flush()
+
+    attachments = orjson.loads(notifier._client.post.call_args.kwargs["content"])["attachments"]
+    assert len(attachments) == 2
+
+
+def test_dispatcher_queue_full():
+    """Test that payloads are dropped once the queue is full."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_post(payload):
+        started.set()
+        release.wait(5)
+
+    post = MagicMock(side_effect=slow_post)
+    dispatcher = AlertDispatcher(post, maxsize=1, batch_window=0)
+
+    assert dispatcher.enqueue({"n": 1}) is True
+    # Wait for the worker to pick up the first payload
+    assert started.wait(5)
+    assert dispatcher.enqueue({"n": 2}) is True
+    assert dispatcher.enqueue({"n": 3}) is False
+
+    release.set()
+    dispatcher.close()
+    assert post.call_count == 2
+
+
+def test_alerts_batched_into_one_post(notifier):
+    """Test that alerts queued together are sent as one message."""
+    for i in range(3):
+        notifier.send(f"alert {i}")
+    notifier.flush()
+
+    notifier._client.post.assert_called_once()
+    attachments = orjson.loads(notifier._client.post.call_args.kwargs["content"])["attachments"]
+    assert [a["title"] for a in attachments] == [f"[INFO] alert {i}" for i in range(3)]
+
+
+def test_dispatcher_batch_size_limit():
+    """Test that a batch never exceeds max_batch items."""
+    post = MagicMock()
+    dispatcher = AlertDispatcher(post, max_batch=2, batch_window=1.0)
+
+    for i in range(5):
+        dispatcher.enqueue(i)
+    dispatcher.close()
+
+    batches = [call.args[0] for call in post.call_args_list]
+    assert all(len(batch) <= 2 for batch in batches)
+    assert sum(batches, []) == [0, 1, 2, 3, 4]
+
+
+def test_duplicate_alerts_suppressed(notifier):
+    """Test that an identical alert is only sent once within the TTL."""
+    assert notifier.send("Low balance", "WARNING", {"chain_id": "1"}) is True
+    assert notifier.send("Low balance", "WARNING", {"chain_id": "1"}) is False
+    assert notifier.send("Low balance", "WARNING", {"chain_id": "137"}) is True
+    notifier.flush()
+
+    attachments = orjson.loads(notifier._client.post.call_args.kwargs["content"])["attachments"]
+    assert len(attachments) == 2
+
+
+def test_duplicate_allowed_after_ttl():
+    """Test that an alert is sent again once its dedup entry expires."""
+    notifier = SlackNotifier(WEBHOOK_URL, dedup_ttl=0)
+    notifier._client = MagicMock()
+
+    assert notifier.send("Low balance") is True
+    assert notifier.send("Low balance") is True
+
+
+def test_rate_limit_per_level(notifier):
+    """Test that each level is capped at max_per_minute alerts."""
+    notifier.max_per_minute = 2
+
+    assert notifier.send("one", "ERROR") is True
+    assert notifier.send("two", "ERROR") is True
+    assert notifier.send("three", "ERROR") is False
+    assert notifier.send("four", "INFO") is True
+
+
+def test_unknown_levels_share_one_bucket(notifier):
+    """Test that unknown levels neither get their own budget nor grow the state."""
+    notifier.max_per_minute = 2
+
+    assert notifier.send("one", "DEBUG") is True
+    assert notifier.send("two", "TRACE") is True
+    assert notifier.send("three", "VERBOSE") is False
+    assert set(notifier._sent_at) == {"OTHER"}
+
+
+def test_rate_bucket_is_separate(notifier):
+    """Test that alerts in an explicit bucket do not spend the level's budget."""
+    notifier.max_per_minute = 1
+
+    assert notifier.send("test", "CRITICAL", dedup=False, rate_bucket="TEST") is True
+    assert notifier.send("test", "CRITICAL", dedup=False, rate_bucket="TEST") is False
+    assert notifier.send("Wallet drained", "CRITICAL") is True
+
+
+def test_attachment_template(notifier):
+    """Test the static and per-alert attachment keys."""
+    notifier.send("Unknown level", "DEBUG", {"timestamp": "2025-01-01T00:00:00Z"})
+    notifier.flush()
+
+    attachment = orjson.loads(notifier._client.post.call_args.kwargs["content"])["attachments"][0]
+    assert attachment["pretext"] == "ON1Builder Alert"
+    assert attachment["footer"] == "ON1Builder"
+    assert attachment["fallback"] == attachment["title"] == "[DEBUG] Unknown level"
+    assert attachment["color"] == ALERT_COLORS["INFO"]
+    assert isinstance(attachment["ts"], int)
+    assert attachment["fields"] == [
+        {"title": "timestamp", "value": "2025-01-01T00:00:00Z", "short": True}
+    ]
+
+
+def test_warm_up_connects_to_webhook_host(notifier):
+    """Test that warm-up opens a connection to the webhook host."""
+    notifier.warm_up()
+
+    notifier._client.head.assert_called_once()
+    assert notifier._client.head.call_args.args[0] == "https://hooks.slack.com/"
+
+
+def test_warm_up_ignores_errors(notifier):
+    """Test that a failed warm-up does not raise."""
+    notifier._client.head.side_effect = Exception("unreachable")
+
+    notifier.warm_up()
+
+
+def test_retry_on_server_error(notifier):
+    """Test that 429/5xx responses are retried before giving up."""
+    notifier.RETRY_BACKOFF = 0
+    busy, ok = MagicMock(status_code=503), MagicMock(status_code=200)
+    notifier._client.post.side_effect = [busy, ok]
+
+    notifier._post([{"title": "retry"}])
+
+    assert notifier._client.post.call_count == 2
+    ok.raise_for_status.assert_called_once()
+
+
+def test_large_batch_is_gzipped(notifier):
+    """Test that bodies above gzip_min_bytes are sent compressed."""
+    notifier.gzip_min_bytes = 1024
+    notifier._post([{"title": "x" * 2000}])
+
+    kwargs = notifier._client.post.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert orjson.loads(gzip.decompress(kwargs["content"]))["attachments"][0]["title"] == "x" * 2000
+
+
+def test_small_batch_not_gzipped(notifier):
+    """Test that small bodies are sent uncompressed."""
+    notifier.gzip_min_bytes = 1024
+    notifier._post([{"title": "short"}])
+
+    kwargs = notifier._client.post.call_args.kwargs
+    assert "Content-Encoding" not in kwargs["headers"]
+
+
+def test_gzip_disabled_by_default(notifier):
+    """Test that large bodies are sent uncompressed unless gzip is enabled."""
+    notifier._post([{"title": "x" * 2000}])
+
+    kwargs = notifier._client.post.call_args.kwargs
+    assert "Content-Encoding" not in kwargs["headers"]
+    assert orjson.loads(kwargs["content"])["attachments"][0]["title"] == "x" * 2000
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the transaction simulator.
+"""
+
+from python.transaction_simulator import (
+    SimBatch,
+    SimResult,
+    _sim_kernel,
+    opportunity_inputs,
+    simulate_transaction,
+    simulate_transactions_batch,
+)
+import numpy as np
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_simulate_transaction_defaults():
+    """Test the estimate for a plain ETH opportunity on mainnet."""
+    result = simulate_transaction("1", {})
+
+    assert result == {
+        "success": True,
+        "gas_used": 100000,
+        "gas_price_gwei": 20,
+        "estimated_cost_eth": pytest.approx(0.002),
+        "estimated_profit_eth": pytest.approx(0.005),
+    }
+
+
+def test_simulate_transaction_token_on_polygon():
+    """Test the token gas surcharge and the Polygon gas price."""
+    result = simulate_transaction("137", {"token": "0xToken", "amount": 0.5})
+
+    assert result["gas_used"] == 150000
+    assert result["gas_price_gwei"] == 50
+    assert result["estimated_cost_eth"] == pytest.approx(0.0075)
+    assert result["estimated_profit_eth"] == pytest.approx(0.0025)
+    assert result["success"] is False
+
+
+def test_batch_matches_scalar():
+    """Test that the batch path computes the same values as the scalar path."""
+    opportunities = [
+        ("1", {}),
+        ("137", {"token": "0xToken", "amount": 0.5}),
+        ("42161", {"token": "0xToken", "amount": 3.0}),
+        ("10", {"amount": 0.1}),
+    ]
+
+    batch = simulate_transactions_batch(
+        [chain_id for chain_id, _ in opportunities],
+        [o.get("amount", 1.0) for _, o in opportunities],
+        [bool(o.get("token")) for _, o in opportunities],
+    )
+
+    for i, (chain_id, opportunity) in enumerate(opportunities):
+        expected = simulate_transaction(chain_id, opportunity)
+        for key, value in expected.items():
+            assert getattr(batch, key).tolist()[i] == pytest.approx(value)
+
+
+def test_batch_empty():
+    """Test that an empty batch returns empty arrays."""
+    batch = simulate_transactions_batch([], [], [])
+
+    assert len(batch) == 0
+    assert isinstance(batch.gas_used, np.ndarray)
+    assert batch.results() == []
+
+
+def test_unknown_chain_uses_default_gas_price():
+    """Test that chains missing from the gas price table use the default."""
+    assert simulate_transaction("43114", {})["gas_price_gwei"] == 20
+
+    batch = simulate_transactions_batch(["43114", "137", "43114"], [1.0] * 3, [False] * 3)
+    assert batch.gas_price_gwei.tolist() == [20, 50, 20]
+
+
+def test_batch_results():
+    """Test converting a batch into per-opportunity results."""
+    batch = simulate_transactions_batch(["1", "137"], [1.0, 0.5], [False, True])
+
+    assert isinstance(batch, SimBatch)
+    results = batch.results()
+    assert all(isinstance(result, SimResult) for result in results)
+    assert results[0]._asdict() == simulate_transaction("1", {})
+    assert batch.success.tolist() == [True, False]
+
+
+def test_repeated_simulation_is_cached():
+    """Test that re-simulating an equivalent opportunity hits the kernel cache."""
+    _sim_kernel.cache_clear()
+
+    first = simulate_transaction("10", {"token": "0xToken", "amount": 2})
+    again = simulate_transaction("10", {"token": "0xOther", "amount": "2.0"})
+
+    assert again == first
+    info = _sim_kernel.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_opportunity_inputs():
+    """Test the coercion of token and amount."""
+    assert opportunity_inputs({}) == (False, 1.0)
+    assert opportunity_inputs({"token": "0xToken", "amount": "2.5"}) == (True, 2.5)
+
+
+@pytest.mark.parametrize("amount", ["lots", None, [1], "nan", "inf"])
+def test_invalid_amount_rejected(amount):
+    """Test that non-numeric amounts raise ValueError."""
+    with pytest.raises(ValueError, match="amount must be a number"):
+        simulate_transaction("1", {"amount": amount})